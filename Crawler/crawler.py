@@ -1,245 +1,209 @@
-import re
-import time
-import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
-
-# Import Selenium helpers for waiting and element lookup
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import csv
+import httpx
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+
+# ciso8601 parses ISO timestamps in C; datetime.fromisoformat (also
+# C-implemented, and it accepts Jira's +0000 offsets on Python 3.11+)
+# covers the case where it isn't installed
+try:
+    from ciso8601 import parse_datetime
+except ImportError:
+    from datetime import datetime
+    parse_datetime = datetime.fromisoformat
+
+
+# base URL of the Jira instance we crawl
+JIRA_BASE = "https://issues.apache.org/jira"
+
+# how many issues one search request may return (Jira's per-request cap)
+BATCH_SIZE = 100
+
+# Jira field ids requested from the search endpoint
+ISSUE_FIELDS = [
+    "issuetype", "status", "priority", "resolution", "versions",
+    "fixVersions", "components", "labels", "customfield_12310041",
+    "customfield_12310060", "assignee", "reporter", "created", "updated",
+    "resolutiondate", "description", "comment"
+]
+
+# every column an issue row can have, in output order
+CSV_FIELDS = [
+    'URL', 'Type', 'Status', 'Priority', 'Resolution', 'Affects Version/s',
+    'Fix Version/s', 'Component/s', 'Labels', 'Patch Info',
+    'Estimated Complexity', 'Assignee', 'Reporter', 'Created',
+    'Created Epoch', 'Updated', 'Resolved', 'Description', 'Comments'
+]
+
+
+# builds an httpx client with a connection pool sized for the thread pool
+# and a small retry budget for flaky connections; HTTP/2 lets all requests
+# to the Jira host multiplex over one connection and Brotli shrinks payloads
+def make_client():
+    return httpx.Client(
+        headers={"Accept-Encoding": "gzip, br"},
+        transport=httpx.HTTPTransport(
+            retries=3,
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        ),
+        timeout=30,
+        follow_redirects=True
+    )
 
 
 # cleans up text by replacing lots of whitespace with a single space
 def clean_text(text):
-    return re.sub(r'\s+', ' ', text).strip()
-
-
-# takes the BeautifulSoup object and returns a dict of issue details
-def extract_details(soup):
-    data = {}
-    # Basic details using their IDs
-    fields = {
-        'Type': '#type-val',
-        'Status': '#status-val',
-        'Priority': '#priority-val',
-        'Resolution': '#resolution-val',
-        'Affects Version/s': '#versions-val',
-        'Fix Version/s': '#fixfor-val',
-        'Component/s': '#components-val',
-        'Labels': '#labels-13028113-value'
-    }
-    for key, selector in fields.items():
-        element = soup.select_one(selector)
-        if element:
-            data[key] = element.get_text(strip=True)
-    
-    # Custom fields by their IDs
-    custom_fields = {
-        'Patch Info': '#customfield_12310041-val',
-        'Estimated Complexity': '#customfield_12310060-val'
-    }
-    for key, selector in custom_fields.items():
-        element = soup.select_one(selector)
-        if element:
-            data[key] = element.get_text(strip=True)
-    
-    return data
-
-
-# takes the BeautifulSoup object and returns a dict of people data
-def extract_people_data(soup):
-    people_data = {}
-    people_section = soup.find("div", class_="item-details people-details")
-    if people_section:
-        assignee_elem = people_section.find("span", id="assignee-val")
-        if assignee_elem:
-            people_data["Assignee"] = assignee_elem.get_text(strip=True)
-        
-        reporter_elem = people_section.find("span", id="reporter-val")
-        if reporter_elem:
-            people_data["Reporter"] = reporter_elem.get_text(strip=True)
-    
-    return people_data
-
-
-# takes the BeautifulSoup object and returns a dict of date data
-def extract_date_data(soup):
-    date_data = {}
-    date_fields = {
-        "Created": "created-val",
-        "Updated": "updated-val",
-        "Resolved": "resolutiondate-val"
-    }
-    
-    for key, span_id in date_fields.items():
-        span = soup.find("span", id=span_id)
-        if span:
-            time_elem = span.find("time")
-            if time_elem:
-                date_data[key] = time_elem.get_text(strip=True)
-    
-    return date_data
-
-
-# takes the BeautifulSoup object and returns the description text of the issue
-def extract_description_data(soup):
-    description_div = soup.find("div", id="description-val")
-    if description_div:
-        description_text = description_div.get_text(separator="\n", strip=True)
-        return clean_text(description_text)
-    return ""
-
-
-# takes the BeautifulSoup object and returns a list of comments (as dicts) from the page
-def extract_comments(soup):
-    comments = []
-    container = soup.find("div", id="issue_actions_container")
-    if container is None:
-        return comments
-
-    comment_divs = container.find_all("div", id=re.compile(r"^comment-\d+"))
-    
-    for div in comment_divs:
-        # Find the 'concise' div without using lambda functions
-        concise = None
-        for child in div.find_all("div"):
-            class_list = child.get("class")
-            if class_list is not None and "concise" in class_list:
-                concise = child
-                break
-        if concise is None:
-            continue
-        
-        # Now find the 'action-details' div inside the concise div
-        details = None
-        for child in concise.find_all("div"):
-            class_list = child.get("class")
-            if class_list is not None and "action-details" in class_list:
-                details = child
-                break
-        if details is None:
-            continue
-        
-        # Look for the anchor tag with 'user-hover' class to get the commenter
-        commenter_anchor = None
-        for a in details.find_all("a"):
-            class_list = a.get("class")
-            if class_list is not None and "user-hover" in class_list:
-                commenter_anchor = a
-                break
-        if commenter_anchor is not None:
-            commenter = commenter_anchor.get_text(strip=True)
-        else:
-            commenter = "Unknown"
-            
-        comment_text = details.get_text(separator=" ", strip=True)
-        
-        comments.append({
-            "commenter": clean_text(commenter),
-            "comment": clean_text(comment_text)
-        })
-    
-    return comments
-
-
-# takes the URL of the issue and the selenium webdriver instance
-# uses Selenium to load the issue page, then passes it to our scraping functions
-def process_issue(url, driver):
-    driver.get(url)
-    driver.implicitly_wait(10)
-    time.sleep(2)  # slow down a bit to see the page
-    html = driver.page_source
-    soup = BeautifulSoup(html, "html.parser")
-    
-    # Get all the extracted data
-    issue_data = {"URL": url}
-    issue_data.update(extract_details(soup))
-    issue_data.update(extract_people_data(soup))
-    issue_data.update(extract_date_data(soup))
-    issue_data["Description"] = extract_description_data(soup)
-    
-    # Flatten comments into a single string
-    comments = extract_comments(soup)
-    if comments:
-        formatted_comments = " | ".join([f"{c['commenter']}: {c['comment']}" for c in comments])
-    else:
-        formatted_comments = ""
-    issue_data["Comments"] = formatted_comments
-    
-    return issue_data
+    return ' '.join(text.split())
+
+
+# converts a Jira ISO timestamp (e.g. 2016-12-11T10:34:06.000+0000) to epoch seconds
+def iso_to_epoch(iso_str):
+    return int(parse_datetime(iso_str).timestamp())
+
+
+# joins the name attribute of a list of Jira field values (versions, components)
+def join_names(values):
+    return ",".join(value["name"] for value in values)
+
+
+# custom field values come back as plain strings or as dicts with a "value" key
+def custom_field_value(value):
+    if isinstance(value, dict):
+        return value.get("value", "")
+    return value or ""
+
+
+# takes one issue from the search response and returns a flat dict for the CSV
+def extract_issue_data(issue):
+    fields = issue["fields"]
+    issue_data = {"URL": f"{JIRA_BASE}/browse/{issue['key']}"}
+
+    # Basic details
+    if fields.get("issuetype"):
+        issue_data["Type"] = fields["issuetype"]["name"]
+    if fields.get("status"):
+        issue_data["Status"] = fields["status"]["name"]
+    if fields.get("priority"):
+        issue_data["Priority"] = fields["priority"]["name"]
+    issue_data["Resolution"] = fields["resolution"]["name"] if fields.get("resolution") else "Unresolved"
+    issue_data["Affects Version/s"] = join_names(fields.get("versions") or [])
+    issue_data["Fix Version/s"] = join_names(fields.get("fixVersions") or [])
+    issue_data["Component/s"] = join_names(fields.get("components") or [])
+    issue_data["Labels"] = ",".join(fields.get("labels") or [])
+
+    # Custom fields
+    issue_data["Patch Info"] = custom_field_value(fields.get("customfield_12310041"))
+    issue_data["Estimated Complexity"] = custom_field_value(fields.get("customfield_12310060"))
+
+    # People
+    if fields.get("assignee"):
+        issue_data["Assignee"] = fields["assignee"]["displayName"]
+    if fields.get("reporter"):
+        issue_data["Reporter"] = fields["reporter"]["displayName"]
+
+    # Dates, with the created date also as an epoch timestamp
+    if fields.get("created"):
+        issue_data["Created"] = fields["created"]
+        issue_data["Created Epoch"] = iso_to_epoch(fields["created"])
+    if fields.get("updated"):
+        issue_data["Updated"] = fields["updated"]
+    if fields.get("resolutiondate"):
+        issue_data["Resolved"] = fields["resolutiondate"]
+
+    # Description with all newlines removed so the CSV stays intact
+    issue_data["Description"] = clean_text(fields.get("description") or "")
+
+    # Flatten comments into a single Author:epoch:date: text line. The raw
+    # bodies are joined first and whitespace is normalized in one pass over
+    # the whole line, so the C-level split/join runs once per issue instead
+    # of once per comment.
+    comments = (fields.get("comment") or {}).get("comments", [])
+    formatted = []
+    for comment in comments:
+        author = comment.get("author", {}).get("displayName", "Unknown")
+        created = comment.get("created", "")
+        epoch = iso_to_epoch(created) if created else ""
+        formatted.append(f"{author}:{epoch}:{created}: {comment.get('body') or ''}")
+    issue_data["Comments"] = clean_text(" | ".join(formatted))
 
+    return issue_data
 
-# writes a list of issue dicts to a CSV file using Pandas
-def write_to_csv(data, filename):
-    df = pd.DataFrame(data)
-    df.to_csv(filename, index=False)
-    print(f"Data written to {filename}")
 
+# fetches one batch of fully-populated issues with a single search request
+def fetch_issue_batch(client, keys):
+    print(f"Fetching batch of {len(keys)} issues ({keys[0]}..{keys[-1]})")
+    response = client.post(
+        f"{JIRA_BASE}/rest/api/2/search",
+        json={
+            "jql": f"key in ({','.join(keys)})",
+            "fields": ISSUE_FIELDS,
+            "maxResults": len(keys)
+        }
+    )
+    response.raise_for_status()
+    result = orjson.loads(response.content)
+    return result.get("issues", [])
+
+
+# pages through the Jira search REST API and returns the list of issue keys
+def crawl_issue_keys(client, project):
+    issue_keys = []
+    seen_keys = set()  # O(1) membership check instead of scanning the list
+    start_at = 0
 
-# crawls the issue list page by clicking the "Next" button until no more pages are available.
-def crawl_issue_list(driver, start_url):
-    issue_urls = []
-    driver.get(start_url)
-    time.sleep(2)  # wait for the page to load
-    
     while True:
-        html = driver.page_source
-        soup = BeautifulSoup(html, "html.parser")
-        
-        # Scrape all issues in the <ol class="issue-list">
-        issue_list = soup.find("ol", class_="issue-list")
-        if issue_list:
-            li_items = issue_list.find_all("li")
-            for li in li_items:
-                a_tag = li.find("a", class_="splitview-issue-link")
-                if a_tag:
-                    href = a_tag.get("href")
-                    if href.startswith("/"):
-                        href = "https://issues.apache.org" + href
-                    if href not in issue_urls:
-                        issue_urls.append(href)
-        
-        # Try to click the "Next" button
-        try:
-            # Wait for the next button to be clickable
-            next_button = WebDriverWait(driver, 10).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "a.nav-next"))
-            )
-            print("Clicking Next button...")
-            next_button.click()
-            time.sleep(2)  # wait for new page to load
-        except Exception as e:
-            print("No more pages or error clicking next:", e)
+        response = client.get(
+            f"{JIRA_BASE}/rest/api/2/search",
+            params={
+                "jql": f"project={project}",
+                "startAt": start_at,
+                "maxResults": BATCH_SIZE,
+                "fields": "key"
+            }
+        )
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        issues = result.get("issues", [])
+        if not issues:
+            break
+
+        for issue in issues:
+            key = issue['key']
+            if key not in seen_keys:
+                seen_keys.add(key)
+                issue_keys.append(key)
+
+        start_at += len(issues)
+        print(f"Fetched {start_at} of {result.get('total', '?')} issue keys")
+        if start_at >= result.get("total", 0):
             break
-    
-    return issue_urls
-
-
-# main function to crawl all active issues, process each issue, and export to CSV
-def main(start_url, output_csv="issues_data.csv"):
-    chrome_options = Options()
-    chrome_options.add_argument("--headless=new")
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-    
-    print(f"Starting crawl at: {start_url}")
-    issue_urls = crawl_issue_list(driver, start_url)
-    print(f"Found {len(issue_urls)} issues")
-    
-    all_issues_data = []
-    for url in issue_urls:
-        print(f"Processing issue: {url}")
-        issue_data = process_issue(url, driver)
-        all_issues_data.append(issue_data)
-    
-    driver.quit()
-    write_to_csv(all_issues_data, output_csv)
+
+    return issue_keys
+
+
+# main function to crawl all issues of a project, process each issue, and export to CSV
+def main(project, output_csv="issues_data.csv"):
+    client = make_client()
+
+    print(f"Starting crawl for project: {project}")
+    issue_keys = crawl_issue_keys(client, project)
+    print(f"Found {len(issue_keys)} issues")
+
+    # One search request returns up to 100 fully-populated issues, so the
+    # issue data arrives in N/100 round trips fetched concurrently. Rows are
+    # written to the CSV as they arrive instead of being collected in memory.
+    batches = [issue_keys[i:i + BATCH_SIZE] for i in range(0, len(issue_keys), BATCH_SIZE)]
+    with open(output_csv, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS, restval="")
+        writer.writeheader()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for issues in executor.map(lambda keys: fetch_issue_batch(client, keys), batches):
+                for issue in issues:
+                    writer.writerow(extract_issue_data(issue))
+
+    print(f"Data written to {output_csv}")
 
 
 if __name__ == '__main__':
-    # Starting URL for active CAMEL issues
-    start_url = "https://issues.apache.org/jira/projects/CAMEL/issues"
-    main(start_url, output_csv="issues_data.csv")
+    main("CAMEL", output_csv="issues_data.csv")
@@ -1,7 +1,13 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
 import re
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -14,11 +20,83 @@ auth_header = {
     "Accept": "application/vnd.github+json"
 }
 
+# Pre-compiled pattern for the last-page number in the Link response header
+LINK_LAST_RE = re.compile(r'page=(\d+)>; rel="last"')
+
+# Shared session so the many API calls reuse pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake each time
+session = requests.Session()
+session.mount("https://", HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to pace GitHub API calls.
+
+    Parameters:
+        rate (float): Tokens refilled per second.
+        burst (int): Maximum number of tokens held at once.
+    """
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until the bucket refills if it is empty."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+# GitHub allows 5000 requests/hour with a token, so pace just under that
+bucket = TokenBucket(rate=5000 / 3600, burst=20)
+
+# Start backing off once this few requests remain in the rate-limit window
+RATE_LIMIT_THRESHOLD = 50
+
+def api_get(url, **kwargs):
+    """
+    Rate-limited session.get for GitHub API calls.
+
+    Waits for a bucket token before sending, and when the response reports
+    fewer than RATE_LIMIT_THRESHOLD requests remaining, sleeps until the
+    window resets so later calls don't cascade into 403s (which would
+    silently turn into zero counts downstream).
+
+    Parameters:
+        url (str): URL to fetch.
+        **kwargs: Passed through to session.get.
+
+    Returns:
+        requests.Response: The API response.
+    """
+    bucket.acquire()
+    response = session.get(url, **kwargs)
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    if remaining is not None and reset is not None and int(remaining) < RATE_LIMIT_THRESHOLD:
+        wait = max(0, int(reset) - time.time())
+        print(f"Rate limit nearly exhausted, sleeping {wait:.0f}s until reset")
+        time.sleep(wait)
+    return response
+
 # Retrieve Kaggle organization repositories
 kaggle_org_repo_url = "https://api.github.com/orgs/Kaggle/repos"
-response = requests.get(kaggle_org_repo_url, headers=auth_header)
+response = api_get(kaggle_org_repo_url, headers=auth_header)
 try:
-    kaggle_org_repos = response.json()
+    kaggle_org_repos = orjson.loads(response.content)
 except ValueError:
     kaggle_org_repos = []
 
@@ -34,28 +112,30 @@ def get_paged_info(owner, repo, endpoints=['commits', 'contributors', 'branches'
     Returns:
         list of tuples: Each tuple contains (endpoint, count).
     """
-    counts = []
-    for endpoint in endpoints:
+    def fetch_endpoint_count(endpoint):
         url = f'https://api.github.com/repos/{owner}/{repo}/{endpoint}?per_page=1'
-        response = requests.get(url, headers=auth_header)
-        
+        response = api_get(url, headers=auth_header)
+
         if response.status_code == 204:
-            counts.append((endpoint, 0))
+            return (endpoint, 0)
+
+        try:
+            data = orjson.loads(response.content)
+        except ValueError:
+            data = None
+
+        if data is None:
+            return (endpoint, 0)
+        elif 'Link' in response.headers:
+            # Extract last page number from Link header if paginated
+            match = LINK_LAST_RE.search(response.headers['Link'])
+            return (endpoint, int(match.group(1))) if match else (endpoint, len(data))
         else:
-            try:
-                data = response.json()
-            except ValueError:
-                data = None
-
-            if data is None:
-                counts.append((endpoint, 0))
-            elif 'Link' in response.headers:
-                # Extract last page number from Link header if paginated
-                match = re.search(r'page=(\d+)>; rel="last"', response.headers['Link'])
-                counts.append((endpoint, int(match.group(1))) if match else (endpoint, len(data)))
-            else:
-                counts.append((endpoint, len(data)) if isinstance(data, list) else (endpoint, 0))
-    return counts
+            return (endpoint, len(data)) if isinstance(data, list) else (endpoint, 0)
+
+    # The endpoint queries are independent, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        return list(executor.map(fetch_endpoint_count, endpoints))
 
 def get_closed_issues_count(owner, repo, token=None):
     """
@@ -75,9 +155,9 @@ def get_closed_issues_count(owner, repo, token=None):
         headers["Authorization"] = f"token {token}"
     query = f"repo:{owner}/{repo} is:issue is:closed"
     params = {"q": query}
-    response = requests.get(url, headers=headers, params=params)
+    response = api_get(url, headers=headers, params=params)
     try:
-        data = response.json()
+        data = orjson.loads(response.content)
     except ValueError:
         data = {}
     return data.get("total_count", 0)
@@ -97,11 +177,11 @@ def get_repo_languages(owner, repo):
         list of tuples: Each tuple represents a language's statistics.
     """
     url = f"https://api.codetabs.com/v1/loc?github={owner}/{repo}"
-    response = requests.get(url)
+    response = session.get(url)
     if response.status_code != 200:
         raise Exception(f"Error fetching languages: {response.status_code}")
     
-    data = response.json()  # data is a list of dicts
+    data = orjson.loads(response.content)  # data is a list of dicts
     # Convert each dictionary into a tuple with the keys in the desired order
     result = []
     for entry in data:
@@ -124,9 +204,9 @@ def get_repo_info(owner, repo):
     
     # Get repository details
     repo_url = f'https://api.github.com/repos/{owner}/{repo}'
-    repo_response = requests.get(repo_url, headers=auth_header)
+    repo_response = api_get(repo_url, headers=auth_header)
     try:
-        repo_data = repo_response.json()
+        repo_data = orjson.loads(repo_response.content)
     except ValueError:
         repo_data = {}
     
@@ -136,9 +216,9 @@ def get_repo_info(owner, repo):
     
     # Get environments count
     env_url = f'https://api.github.com/repos/{owner}/{repo}/environments'
-    env_response = requests.get(env_url, headers=auth_header)
+    env_response = api_get(env_url, headers=auth_header)
     try:
-        env_data = env_response.json()
+        env_data = orjson.loads(env_response.content)
     except ValueError:
         env_data = {}
     environments = env_data.get('total_count', 0)
@@ -166,17 +246,26 @@ def save_data_to_json(data, filename_prefix="data"):
         json.dump(data, f, indent=4)
     print(f"Data saved to {filename}")
 
+def collect_repo_data(repo):
+    """
+    Collect metrics and language statistics for a single repository.
+
+    Parameters:
+        repo (dict): Repository entry as returned by the org repos endpoint.
+
+    Returns:
+        dict: Repository name plus its metrics and languages.
+    """
+    repo_name = repo.get('name')
+    return {
+        "repository": repo_name,
+        "metrics": get_repo_info('Kaggle', repo_name),
+        "languages": get_repo_languages('Kaggle', repo_name)
+    }
+
 if __name__ == "__main__":
-    all_repo_data = []
-    for repo in kaggle_org_repos:
-        repo_name = repo.get('name')
-        repo_metrics = get_repo_info('Kaggle', repo_name)
-        repo_languages = get_repo_languages('Kaggle', repo_name)
-        repo_data = {
-            "repository": repo_name,
-            "metrics": repo_metrics,
-            "languages": repo_languages
-        }
-        all_repo_data.append(repo_data)
-    
+    # The per-repo collection is pure API latency, so fan out across threads
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        all_repo_data = list(executor.map(collect_repo_data, kaggle_org_repos))
+
     save_data_to_json(all_repo_data, filename_prefix="kaggle_data")
\ No newline at end of file